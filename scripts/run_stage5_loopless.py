@@ -14,12 +14,12 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from stage5 import Stage5Pipeline
+from stage5 import get_pipeline
 
 
 class Stage5Demo:
     def __init__(self) -> None:
-        self.pipeline = Stage5Pipeline()
+        self.pipeline = get_pipeline()
 
     def run_batch(self, problems: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         results = []
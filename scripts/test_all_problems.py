@@ -15,7 +15,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from stage5 import Stage5Pipeline
+from stage5 import get_pipeline
 
 
 def load_test_problems():
@@ -28,7 +28,7 @@ def load_test_problems():
 def test_all_problems():
     """Test all 6 problems"""
     problems = load_test_problems()
-    pipeline = Stage5Pipeline()
+    pipeline = get_pipeline()
 
     print("="*70)
     print("Stage5 General Solver - Test All Problems")
@@ -1,3 +1,3 @@
 # echo_engine/stage5/__init__.py
-from .pipeline import Stage5Pipeline
+from .pipeline import Stage5Pipeline, get_pipeline
 from .gate import GateDecision, GateRoute
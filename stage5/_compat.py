@@ -0,0 +1,5 @@
+# stage5/_compat.py
+import sys
+
+# dataclass(slots=True) needs Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -14,6 +14,11 @@ from .extractor import (
     CalculusExtracted,
     PatternKind
 )
+from .kernels import ccomb
+
+
+# 6**n for the dice counts the extractor accepts (one..six)
+_SIX_POW = (1, 6, 36, 216, 1296, 7776, 46656)
 
 
 @dataclass(frozen=True)
@@ -26,33 +31,32 @@ class Stage5Explainer:
     Only for PASS results. STOP must remain silent (empty text).
     """
 
+    def __init__(self) -> None:
+        # Indexed by PatternKind value
+        self._dispatch = (
+            self._explain_combinatorics,
+            self._explain_algebra,
+            self._explain_number_theory,
+            self._explain_geometry,
+            self._explain_probability,
+            self._explain_calculus,
+        )
+
     def explain(
         self,
         extracted: Extracted,
         answer: Union[int, float, str, List[Tuple[str, float, float]]]
     ) -> Explained:
         """Dispatch to appropriate explainer based on pattern kind"""
-        if extracted.kind == PatternKind.COMBINATORICS:
-            return self._explain_combinatorics(extracted, answer)
-        elif extracted.kind == PatternKind.ALGEBRA:
-            return self._explain_algebra(extracted, answer)
-        elif extracted.kind == PatternKind.NUMBER_THEORY:
-            return self._explain_number_theory(extracted, answer)
-        elif extracted.kind == PatternKind.GEOMETRY:
-            return self._explain_geometry(extracted, answer)
-        elif extracted.kind == PatternKind.PROBABILITY:
-            return self._explain_probability(extracted, answer)
-        elif extracted.kind == PatternKind.CALCULUS:
-            return self._explain_calculus(extracted, answer)
-        else:
+        if not isinstance(extracted.kind, PatternKind):
             return Explained(text="")
+        return self._dispatch[extracted.kind](extracted, answer)
 
     def _explain_combinatorics(self, ex: CombinatoricsExtracted, answer: int) -> Explained:
         """Explain combinatorics solution"""
         case_explanations = []
         for k1, k2 in ex.cases:
-            from math import comb
-            val = comb(ex.n1, k1) * comb(ex.n2, k2)
+            val = ccomb(ex.n1, k1) * ccomb(ex.n2, k2)
             case_explanations.append(f"  Case ({k1} men, {k2} women): C({ex.n1},{k1}) × C({ex.n2},{k2}) = {val}")
 
         text = "Combinatorics (Committee Selection):\n"
@@ -85,7 +89,7 @@ class Stage5Explainer:
 
     def _explain_probability(self, ex: ProbabilityExtracted, answer: float) -> Explained:
         """Explain probability solution"""
-        total = 6 ** ex.num_dice
+        total = _SIX_POW[ex.num_dice] if ex.num_dice < len(_SIX_POW) else 6 ** ex.num_dice
         favorable = int(answer * total)
         text = f"Probability (Dice Sum):\n"
         text += f"  {ex.num_dice} dice, target sum = {ex.target_sum}\n"
@@ -1,19 +1,27 @@
 # stage5/extractor.py
 from __future__ import annotations
 
-import re
+# RE2 runs in linear time (no backtracking); all patterns below are
+# RE2-compatible, so fall back to the stdlib engine when it is absent.
+try:
+    import re2 as re
+except ImportError:
+    import re
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict
-from enum import Enum
+from enum import IntEnum
 
+from . import keywords as kw
 
-class PatternKind(str, Enum):
-    COMBINATORICS = "combinatorics"
-    ALGEBRA = "algebra"
-    NUMBER_THEORY = "number_theory"
-    GEOMETRY = "geometry"
-    PROBABILITY = "probability"
-    CALCULUS = "calculus"
+
+class PatternKind(IntEnum):
+    # Values are dense from 0 so components can index dispatch tables by kind
+    COMBINATORICS = 0
+    ALGEBRA = 1
+    NUMBER_THEORY = 2
+    GEOMETRY = 3
+    PROBABILITY = 4
+    CALCULUS = 5
 
 
 @dataclass(frozen=True)
@@ -59,32 +67,72 @@ class CalculusExtracted(Extracted):
     coefficients: List[float]  # [a_n, a_(n-1), ..., a_1, a_0]
 
 
+# Value-extraction patterns, compiled once at import (text is lowercased)
+# Combinatorics
+_RE_MEN_WOMEN = re.compile(r"(\d+)\s+men.*?(\d+)\s+women")
+_RE_COMMITTEE_SIZE = re.compile(r"committee\s+of\s+(\d+)|(\d+)\s+people")
+_RE_MIN_MEN = re.compile(r"at\s+least\s+(\d+)\s+men")
+_RE_MIN_WOMEN = re.compile(r"at\s+least\s+(\d+)\s+wom[ae]n")
+# Algebra
+_RE_X2_PLUS_Y2 = re.compile(r"(?:x\^2|x²|x\*\*2)\s*\+\s*(?:y\^2|y²|y\*\*2)\s*=\s*(\d+)")
+_RE_XY = re.compile(r"xy\s*=\s*(\d+)|x\s*\*\s*y\s*=\s*(\d+)")
+# Number theory
+_RE_DIVISORS_OF = re.compile(r"divisors?\s+of\s+(\d+)|factors?\s+of\s+(\d+)")
+# Geometry
+_RE_RADIUS = re.compile(r"radius\s+(?:is\s+)?(\d+)")
+_RE_TANGENT = re.compile(r"tangent.*?(?:length\s+)?(?:is\s+)?(\d+)")
+# Probability
+_RE_NUM_DICE = re.compile(r"(one|two|three|four|five|six|1|2|3|4|5|6)\s+dic[e]")
+_RE_TARGET_SUM = re.compile(r"sum\s+(?:is\s+)?(?:exactly\s+)?(\d+)")
+# Calculus (matched against space-stripped text)
+_RE_CUBIC = re.compile(
+    r"f\(x\)\s*=\s*([+-]?\d*)\s*x\^3\s*([+-]\s*\d+)\s*x\^2\s*([+-]\s*\d+)\s*x\s*([+-]\s*\d+)"
+)
+# "f(x)" as it reads once spaces are stripped (e.g. "f (x)")
+_RE_FX = re.compile(r"f *\( *x *\)")
+# Clause separators; neither char can occur inside a cubic match
+_RE_CLAUSE_SEP = re.compile(r"[,.]")
+
+
 class Stage5Extractor:
     """
     Deterministic pattern extraction only.
     No reasoning, no guessing, only regex/DFA rules.
     """
 
+    def __init__(self) -> None:
+        # (keyword rule, extractor) pairs
+        # Order matters: more specific patterns first
+        self._patterns = (
+            (kw.COMBINATORICS, self._try_combinatorics),
+            (kw.ALGEBRA, self._try_algebra),
+            (kw.NUMBER_THEORY, self._try_number_theory),
+            (kw.GEOMETRY, self._try_geometry),
+            (kw.DICE, self._try_probability),
+            (kw.CALCULUS, self._try_calculus),
+        )
+
     def extract(self, raw: str) -> Optional[Extracted]:
         """Try all patterns in order, return first match"""
-        # Order matters: more specific patterns first
-        patterns = [
-            self._try_combinatorics,
-            self._try_algebra,
-            self._try_number_theory,
-            self._try_geometry,
-            self._try_probability,
-            self._try_calculus,
-        ]
-
-        for pattern_fn in patterns:
-            result = pattern_fn(raw)
+        s = raw.lower()
+        return self.extract_scanned(s, kw.scan(s))
+
+    def extract_scanned(self, s: str, bits: int) -> Optional[Extracted]:
+        """
+        extract() for text that is already lowercased (s) and keyword-scanned
+        (bits = keywords.scan(s)), e.g. by the Gate. Every _try_* shares s;
+        each pattern's keyword precondition is a bit test.
+        """
+        for rule, pattern_fn in self._patterns:
+            if not kw.matches(bits, rule):
+                continue
+            result = pattern_fn(s)
             if result is not None:
                 return result
 
         return None
 
-    def _try_combinatorics(self, raw: str) -> Optional[CombinatoricsExtracted]:
+    def _try_combinatorics(self, s: str) -> Optional[CombinatoricsExtracted]:
         """
         Pattern: "A committee of 5 people from 6 men and 4 women.
                   Must contain at least 3 men and at least 1 woman."
@@ -92,15 +140,8 @@ class Stage5Extractor:
         Extracts: n1=6, n2=4, committee_size=5, min_men=3, min_women=1
         Cases: [(3,2), (4,1)]
         """
-        s = raw.lower()
-
-        # Must have committee/choose keywords AND men/women
-        if not (("committee" in s or "choose" in s or "ways" in s) and
-                ("men" in s and "women" in s)):
-            return None
-
         # Extract numbers: "6 men", "4 women", "committee of 5", "3 men", "1 woman"
-        m = re.search(r"(\d+)\s+men.*?(\d+)\s+women", s)
+        m = _RE_MEN_WOMEN.search(s)
         if not m:
             return None
 
@@ -108,14 +149,14 @@ class Stage5Extractor:
         total_women = int(m.group(2))
 
         # Committee size
-        size_match = re.search(r"committee\s+of\s+(\d+)|(\d+)\s+people", s)
+        size_match = _RE_COMMITTEE_SIZE.search(s)
         if not size_match:
             return None
         committee_size = int(size_match.group(1) or size_match.group(2))
 
         # Constraints: "at least 3 men", "at least 1 woman"
-        min_men_match = re.search(r"at\s+least\s+(\d+)\s+men", s)
-        min_women_match = re.search(r"at\s+least\s+(\d+)\s+wom[ae]n", s)
+        min_men_match = _RE_MIN_MEN.search(s)
+        min_women_match = _RE_MIN_WOMEN.search(s)
 
         if not (min_men_match and min_women_match):
             return None
@@ -142,28 +183,20 @@ class Stage5Extractor:
             cases=cases
         )
 
-    def _try_algebra(self, raw: str) -> Optional[AlgebraExtracted]:
+    def _try_algebra(self, s: str) -> Optional[AlgebraExtracted]:
         """
         Pattern: "If x^2 + y^2 = 25 and xy = 12, find (x + y)^2"
 
         Extracts: x2_plus_y2=25, xy=12
         """
-        s = raw.lower()
-
-        # Must mention x^2 + y^2 and xy
-        if not ("x^2" in s or "x²" in s or "x**2" in s):
-            return None
-        if "xy" not in s and "x*y" not in s:
-            return None
-
         # Extract x^2 + y^2 = value
-        x2_y2_match = re.search(r"(?:x\^2|x²|x\*\*2)\s*\+\s*(?:y\^2|y²|y\*\*2)\s*=\s*(\d+)", s)
+        x2_y2_match = _RE_X2_PLUS_Y2.search(s)
         if not x2_y2_match:
             return None
         x2_plus_y2 = int(x2_y2_match.group(1))
 
         # Extract xy = value
-        xy_match = re.search(r"xy\s*=\s*(\d+)|x\s*\*\s*y\s*=\s*(\d+)", s)
+        xy_match = _RE_XY.search(s)
         if not xy_match:
             return None
         xy = int(xy_match.group(1) or xy_match.group(2))
@@ -178,20 +211,14 @@ class Stage5Extractor:
             xy=xy
         )
 
-    def _try_number_theory(self, raw: str) -> Optional[NumberTheoryExtracted]:
+    def _try_number_theory(self, s: str) -> Optional[NumberTheoryExtracted]:
         """
         Pattern: "Find the sum of all positive divisors of 360"
 
         Extracts: number=360
         """
-        s = raw.lower()
-
-        # Must mention divisors/factors and sum
-        if not (("divisor" in s or "factor" in s) and "sum" in s):
-            return None
-
         # Extract number
-        num_match = re.search(r"divisors?\s+of\s+(\d+)|factors?\s+of\s+(\d+)", s)
+        num_match = _RE_DIVISORS_OF.search(s)
         if not num_match:
             return None
 
@@ -202,26 +229,20 @@ class Stage5Extractor:
             number=number
         )
 
-    def _try_geometry(self, raw: str) -> Optional[GeometryExtracted]:
+    def _try_geometry(self, s: str) -> Optional[GeometryExtracted]:
         """
         Pattern: "Circle with radius 10, tangent from P has length 24. Find distance OP."
 
         Extracts: radius=10, tangent=24
         """
-        s = raw.lower()
-
-        # Must mention circle, radius, and tangent
-        if not ("circle" in s and "radius" in s and "tangent" in s):
-            return None
-
         # Extract radius
-        radius_match = re.search(r"radius\s+(?:is\s+)?(\d+)", s)
+        radius_match = _RE_RADIUS.search(s)
         if not radius_match:
             return None
         radius = float(radius_match.group(1))
 
         # Extract tangent length
-        tangent_match = re.search(r"tangent.*?(?:length\s+)?(?:is\s+)?(\d+)", s)
+        tangent_match = _RE_TANGENT.search(s)
         if not tangent_match:
             return None
         tangent = float(tangent_match.group(1))
@@ -232,20 +253,14 @@ class Stage5Extractor:
             tangent=tangent
         )
 
-    def _try_probability(self, raw: str) -> Optional[ProbabilityExtracted]:
+    def _try_probability(self, s: str) -> Optional[ProbabilityExtracted]:
         """
         Pattern: "Three dice are rolled. Probability that sum is exactly 10?"
 
         Extracts: num_dice=3, target_sum=10
         """
-        s = raw.lower()
-
-        # Must mention dice and probability/sum
-        if not ("dice" in s or "die" in s):
-            return None
-
         # Extract number of dice
-        num_dice_match = re.search(r"(one|two|three|four|five|six|1|2|3|4|5|6)\s+dic[e]", s)
+        num_dice_match = _RE_NUM_DICE.search(s)
         if not num_dice_match:
             return None
 
@@ -257,7 +272,7 @@ class Stage5Extractor:
             return None
 
         # Extract target sum
-        sum_match = re.search(r"sum\s+(?:is\s+)?(?:exactly\s+)?(\d+)", s)
+        sum_match = _RE_TARGET_SUM.search(s)
         if not sum_match:
             return None
         target_sum = int(sum_match.group(1))
@@ -268,26 +283,23 @@ class Stage5Extractor:
             target_sum=target_sum
         )
 
-    def _try_calculus(self, raw: str) -> Optional[CalculusExtracted]:
+    def _try_calculus(self, s: str) -> Optional[CalculusExtracted]:
         """
         Pattern: "f(x) = x^3 - 6x^2 + 9x + 1, find local extrema"
 
         Extracts: coefficients=[1, -6, 9, 1]
         """
-        s = raw.lower()
-
-        # Must mention f(x) and extrema/maximum/minimum
-        if "f(x)" not in s:
-            return None
-        if not ("extrem" in s or "maximum" in s or "minimum" in s):
-            return None
-
         # Extract polynomial: f(x) = ax^3 + bx^2 + cx + d
         # Simplified: only cubic for now
-        poly_match = re.search(
-            r"f\(x\)\s*=\s*([+-]?\d*)\s*x\^3\s*([+-]\s*\d+)\s*x\^2\s*([+-]\s*\d+)\s*x\s*([+-]\s*\d+)",
-            s.replace(" ", "")
-        )
+        # Split once on "," / "." (a match never spans them) and strip spaces
+        # only in clauses mentioning f(x); one search per clause finds the
+        # leftmost match, so the whole text is covered in linear time
+        poly_match = None
+        for clause in _RE_CLAUSE_SEP.split(s):
+            if _RE_FX.search(clause):
+                poly_match = _RE_CUBIC.search(clause.replace(" ", ""))
+                if poly_match:
+                    break
 
         if not poly_match:
             return None
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from operator import itemgetter
 from typing import Any, Dict, Optional
 
+from . import keywords as kw
+
 
 class GateRoute(str, Enum):
     STRUCTURED = "STRUCTURED"    # Fast path -> direct compute (if fields present)
@@ -19,6 +22,25 @@ class GateDecision:
     guard_state: Optional[str] = None
     guard_action: Optional[str] = None  # "STOP" | "ASK" | "TOOL" etc.
     reason: Optional[str] = None
+    # PATTERNABLE only: the matched raw text, its lowercased form, and the
+    # keywords.scan bitmask of that form (reused by the Extractor)
+    raw: Optional[str] = None
+    text: Optional[str] = None
+    keywords: int = 0
+
+
+# Reads (n1, k1, n2, k2) from structured nCk_times_nCk input; the pipeline
+# uses the same getter, so validation and compute read identical fields
+NKNK_FIELDS = itemgetter("n1", "k1", "n2", "k2")
+
+_GATE_RULES = (
+    kw.COMBINATORICS,   # Pattern 1: committee/choose/ways + men + women
+    kw.ALGEBRA,         # Pattern 2: x² + xy
+    kw.NUMBER_THEORY,   # Pattern 3: divisor/factor + sum
+    kw.GEOMETRY,        # Pattern 4: circle + radius + tangent
+    kw.PROBABILITY,     # Pattern 5: dice + sum/probability
+    kw.CALCULUS,        # Pattern 6: f(x) + extrema
+)
 
 
 class Stage5Gate:
@@ -39,8 +61,13 @@ class Stage5Gate:
 
         # 2) Patternable path: raw text present and matches known patterns
         raw = self._get_raw(problem_data)
-        if raw is not None and self._is_patternable(raw):
-            return GateDecision(route=GateRoute.PATTERNABLE)
+        if raw is not None:
+            text = raw.lower()
+            keywords = kw.scan(text)
+            if self._is_patternable(keywords):
+                return GateDecision(
+                    route=GateRoute.PATTERNABLE, raw=raw, text=text, keywords=keywords
+                )
 
         # 3) Otherwise STOP (untrusted / insufficient observation)
         return GateDecision(
@@ -64,41 +91,22 @@ class Stage5Gate:
         Check if problem_data contains pre-extracted structured fields.
         Currently only supports "kind" contract (legacy Stage-0 format).
         """
-        kind = problem_data.get("kind")
-        if kind == "nCk_times_nCk":
-            return all(isinstance(problem_data.get(k), int) for k in ("n1", "k1", "n2", "k2"))
-        return False
-
-    def _is_patternable(self, raw: str) -> bool:
+        if problem_data.get("kind") != "nCk_times_nCk":
+            return False
+        try:
+            n1, k1, n2, k2 = NKNK_FIELDS(problem_data)
+        except KeyError:
+            return False
+        # Exact ints only (bool is not a valid count)
+        return type(n1) is int and type(k1) is int and type(n2) is int and type(k2) is int
+
+    def _is_patternable(self, keywords: int) -> bool:
         """
         Deterministic pattern checks only.
         Keep this fast and conservative.
-        Returns True if ANY pattern matches.
+        Returns True if ANY pattern matches the keyword bitmask.
         """
-        s = raw.lower()
-
-        # Pattern 1: Combinatorics
-        if ("committee" in s or "choose" in s or "ways" in s) and ("men" in s and "women" in s):
-            return True
-
-        # Pattern 2: Algebra (x² + y²)
-        if ("x^2" in s or "x²" in s or "x**2" in s) and ("xy" in s or "x*y" in s):
-            return True
-
-        # Pattern 3: Number Theory (divisors)
-        if ("divisor" in s or "factor" in s) and "sum" in s:
-            return True
-
-        # Pattern 4: Geometry (circle, radius, tangent)
-        if "circle" in s and "radius" in s and "tangent" in s:
-            return True
-
-        # Pattern 5: Probability (dice)
-        if ("dice" in s or "die" in s) and ("sum" in s or "probability" in s):
-            return True
-
-        # Pattern 6: Calculus (f(x), extrema)
-        if "f(x)" in s and ("extrem" in s or "maximum" in s or "minimum" in s):
-            return True
-
+        for rule in _GATE_RULES:
+            if kw.matches(keywords, rule):
+                return True
         return False
@@ -0,0 +1,102 @@
+# stage5/kernels.py
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import compress
+from math import comb, isqrt
+from typing import Iterator, Tuple
+
+
+@lru_cache(maxsize=4096)
+def ccomb(n: int, k: int) -> int:
+    """Memoized C(n, k); solver, verifier and explainer share one cache"""
+    return comb(n, k)
+
+
+@lru_cache(maxsize=64)
+def dice_counts(num_dice: int) -> Tuple[int, ...]:
+    """
+    counts[s] = #ways num_dice six-sided dice sum to s, for s in 0..6*num_dice.
+    Each die convolves the distribution with [1]*6 via a sliding-window sum,
+    so the whole table costs O(num_dice² × 6) once and is cached per num_dice.
+    """
+    counts = [1]
+    for _ in range(num_dice):
+        nxt = [0] * (len(counts) + 6)
+        window = 0
+        for s in range(1, len(nxt)):
+            # window = counts[s-6] + ... + counts[s-1]
+            if s - 1 < len(counts):
+                window += counts[s - 1]
+            if s - 7 >= 0:
+                window -= counts[s - 7]
+            nxt[s] = window
+        counts = nxt
+    return tuple(counts)
+
+
+# Trial division uses sieved primes up to this bound, then the wheel below.
+# Kept small so the first sigma() call stays cheap: 10**4 covers every
+# n < 10**8 by primes alone, and larger n continue on the wheel.
+_SIEVE_LIMIT = 10 ** 4
+
+# 2-3-5 wheel: gaps between successive candidates coprime to 30, from 7
+_WHEEL = (4, 2, 4, 2, 4, 6, 2, 6)
+_WHEEL_CYCLE = (7, 11, 13, 17, 19, 23, 29, 31)
+
+
+def _wheel_resume(limit: int) -> Tuple[int, int]:
+    """First wheel candidate above limit, with its index into _WHEEL"""
+    base = 30 * ((limit - 7) // 30)
+    for wi, c in enumerate(_WHEEL_CYCLE):
+        if base + c > limit:
+            return base + c, wi
+    return base + 30 + 7, 0
+
+
+_WHEEL_RESUME = _wheel_resume(_SIEVE_LIMIT)
+
+
+@lru_cache(maxsize=None)
+def small_primes() -> Tuple[int, ...]:
+    """Primes up to _SIEVE_LIMIT (sieve of Eratosthenes), built on first use"""
+    is_prime = bytearray([1]) * (_SIEVE_LIMIT + 1)
+    is_prime[0] = is_prime[1] = 0
+    for i in range(2, isqrt(_SIEVE_LIMIT) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = bytes(len(range(i * i, _SIEVE_LIMIT + 1, i)))
+    return tuple(compress(range(_SIEVE_LIMIT + 1), is_prime))
+
+
+def _trial_divisors() -> Iterator[int]:
+    """Sieved primes, then 2-3-5 wheel candidates past the sieve"""
+    yield from small_primes()
+    d, wi = _WHEEL_RESUME
+    while True:
+        yield d
+        d += _WHEEL[wi]
+        wi = (wi + 1) & 7
+
+
+@lru_cache(maxsize=2048)
+def sigma(n: int) -> int:
+    """
+    σ(n), the sum of all positive divisors, by trial division.
+    Multiplies in (p^(k+1) - 1) / (p - 1) per prime power as it is found,
+    without building a factorization dict. Results are memoized.
+    """
+    if n < 2:
+        return 1
+    s = 1
+    for d in _trial_divisors():
+        if d * d > n:
+            break
+        if n % d == 0:
+            pk = 1
+            while n % d == 0:
+                n //= d
+                pk *= d
+            s *= (pk * d - 1) // (d - 1)
+    if n > 1:
+        s *= n + 1
+    return s
@@ -0,0 +1,56 @@
+# stage5/keywords.py
+from __future__ import annotations
+
+from typing import Tuple
+
+# Keyword vocabulary shared by Gate and Extractor; each keyword owns one bit.
+KEYWORDS: Tuple[str, ...] = (
+    "committee", "choose", "ways", "men", "women",
+    "x^2", "x²", "x**2", "xy", "x*y",
+    "divisor", "factor", "sum",
+    "circle", "radius", "tangent",
+    "dice", "die", "probability",
+    "f(x)", "extrem", "maximum", "minimum",
+)
+
+_BITS = {kw: 1 << i for i, kw in enumerate(KEYWORDS)}
+_KEYWORD_BITS: Tuple[Tuple[str, int], ...] = tuple(_BITS.items())
+
+
+def mask(*keywords: str) -> int:
+    """Bitmask with one bit set per keyword"""
+    bits = 0
+    for kw in keywords:
+        bits |= _BITS[kw]
+    return bits
+
+
+# A rule is a tuple of any-of masks; ALL of them must be hit.
+Rule = Tuple[int, ...]
+
+COMBINATORICS: Rule = (mask("committee", "choose", "ways"), mask("men"), mask("women"))
+ALGEBRA: Rule = (mask("x^2", "x²", "x**2"), mask("xy", "x*y"))
+NUMBER_THEORY: Rule = (mask("divisor", "factor"), mask("sum"))
+GEOMETRY: Rule = (mask("circle"), mask("radius"), mask("tangent"))
+DICE: Rule = (mask("dice", "die"),)
+PROBABILITY: Rule = DICE + (mask("sum", "probability"),)
+CALCULUS: Rule = (mask("f(x)"), mask("extrem", "maximum", "minimum"))
+
+
+def scan(s: str) -> int:
+    """Bitmask of keywords present in lowercased text"""
+    # One C-level substring search per keyword beats a regex alternation
+    # tried at every position
+    bits = 0
+    for k, bit in _KEYWORD_BITS:
+        if k in s:
+            bits |= bit
+    return bits
+
+
+def matches(bits: int, rule: Rule) -> bool:
+    """True if every any-of mask in rule has at least one keyword present"""
+    for m in rule:
+        if not bits & m:
+            return False
+    return True
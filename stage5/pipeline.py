@@ -1,17 +1,20 @@
 # stage5/pipeline.py
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union, List, Tuple
+from typing import Any, Callable, Dict, Optional, Union, List, Tuple
 
-from .gate import GateRoute, Stage5Gate
+from .gate import GateRoute, Stage5Gate, NKNK_FIELDS
 from .extractor import Stage5Extractor, Extracted
 from .solver import Stage5Solver
 from .verifier import Stage5Verifier
 from .explainer import Stage5Explainer
+from ._compat import DATACLASS_SLOTS
+from .kernels import ccomb
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Stage5Response:
     ok: bool
     answer: Optional[Union[int, float, str]] = None
@@ -23,6 +26,42 @@ class Stage5Response:
     reason: Optional[str] = None
 
 
+def _compute_nCk_times_nCk(problem_data: Dict[str, Any]) -> Tuple[int, str]:
+    n1, k1, n2, k2 = NKNK_FIELDS(problem_data)
+    answer = ccomb(n1, k1) * ccomb(n2, k2)
+    return answer, f"Structured compute: C({n1},{k1}) × C({n2},{k2}) = {answer}"
+
+
+# Structured "kind" -> handler returning (answer, explanation text)
+_STRUCT_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Tuple[int, str]]] = {
+    "nCk_times_nCk": _compute_nCk_times_nCk,
+}
+
+# Max raw texts whose extraction result is kept (LRU)
+_EXTRACT_CACHE_SIZE = 4096
+_MISS = object()
+
+# Fixed STOP responses of the PATTERNABLE path (immutable, shared)
+_NO_RAW_TEXT = Stage5Response(
+    ok=False,
+    text="",
+    guard_code="NO_RAW_TEXT",
+    guard_state="NO_RAW_TEXT",
+    guard_action="STOP",
+    route=GateRoute.PATTERNABLE.value,
+    reason="No raw text found in input",
+)
+_EXTRACT_FAIL = Stage5Response(
+    ok=False,
+    text="",
+    guard_code="EXTRACT_FAIL",
+    guard_state="EXTRACT_FAIL",
+    guard_action="STOP",
+    route=GateRoute.PATTERNABLE.value,
+    reason="Deterministic extraction failed - pattern not recognized",
+)
+
+
 class Stage5Pipeline:
     """
     Deterministic pipeline for 6 math problem patterns.
@@ -37,6 +76,8 @@ class Stage5Pipeline:
         self.solver = Stage5Solver()
         self.verifier = Stage5Verifier()
         self.explainer = Stage5Explainer()
+        # raw text -> extraction result (None = no pattern); bounded LRU
+        self._extract_cache: OrderedDict[str, Optional[Extracted]] = OrderedDict()
 
     def solve(self, problem_data: Dict[str, Any]) -> Stage5Response:
         """
@@ -65,7 +106,15 @@ class Stage5Pipeline:
             return self._handle_structured(problem_data, decision)
 
         # PATTERNABLE path (raw text → extract → solve)
-        return self._handle_patternable(problem_data, decision)
+        return self._handle_patternable(decision)
+
+    def solve_batch(self, problems: List[Dict[str, Any]]) -> List[Stage5Response]:
+        """
+        Convenience wrapper: solve() applied to each problem in turn.
+        Results are returned in input order (index i ↔ problems[i]).
+        """
+        solve = self.solve
+        return [solve(problem_data) for problem_data in problems]
 
     def _handle_structured(
         self,
@@ -74,7 +123,8 @@ class Stage5Pipeline:
     ) -> Stage5Response:
         """Handle pre-structured input (legacy)"""
         kind = problem_data.get("kind")
-        if kind != "nCk_times_nCk":
+        handler = _STRUCT_HANDLERS.get(kind)
+        if handler is None:
             return Stage5Response(
                 ok=False,
                 text="",
@@ -85,52 +135,20 @@ class Stage5Pipeline:
                 reason=f"Unsupported structured kind: {kind}",
             )
 
-        # Legacy compute for nCk_times_nCk
-        from math import comb
-        n1, k1, n2, k2 = problem_data["n1"], problem_data["k1"], problem_data["n2"], problem_data["k2"]
-        answer = comb(n1, k1) * comb(n2, k2)
-
         # Verification not needed for STRUCTURED path (trusted input)
-        text = f"Structured compute: C({n1},{k1}) × C({n2},{k2}) = {answer}"
+        answer, text = handler(problem_data)
         return Stage5Response(ok=True, answer=answer, text=text, route=decision.route.value)
 
-    def _handle_patternable(
-        self,
-        problem_data: Dict[str, Any],
-        decision
-    ) -> Stage5Response:
+    def _handle_patternable(self, decision) -> Stage5Response:
         """Handle raw text extraction and solving"""
-        # Get raw text
-        raw = None
-        for key in ("raw", "problem", "text"):
-            val = problem_data.get(key)
-            if isinstance(val, str) and val.strip():
-                raw = val
-                break
-
-        if raw is None:
-            return Stage5Response(
-                ok=False,
-                text="",
-                guard_code="NO_RAW_TEXT",
-                guard_state="NO_RAW_TEXT",
-                guard_action="STOP",
-                route=decision.route.value,
-                reason="No raw text found in input",
-            )
+        # Raw text was already located by the gate; no second key scan
+        if decision.raw is None:
+            return _NO_RAW_TEXT
 
         # Extract pattern
-        extracted = self.extractor.extract(raw)
+        extracted = self._extract(decision)
         if extracted is None:
-            return Stage5Response(
-                ok=False,
-                text="",
-                guard_code="EXTRACT_FAIL",
-                guard_state="EXTRACT_FAIL",
-                guard_action="STOP",
-                route=decision.route.value,
-                reason="Deterministic extraction failed - pattern not recognized",
-            )
+            return _EXTRACT_FAIL
 
         # Solve using extracted values
         try:
@@ -173,19 +191,51 @@ class Stage5Pipeline:
             route=decision.route.value
         )
 
+    def _extract(self, decision) -> Optional[Extracted]:
+        """
+        Extract using the Gate's lowercased text and keyword scan,
+        with an LRU cache keyed by raw text.
+        """
+        raw = decision.raw
+        cache = self._extract_cache
+        extracted = cache.get(raw, _MISS)
+        if extracted is _MISS:
+            extracted = self.extractor.extract_scanned(decision.text, decision.keywords)
+            cache[raw] = extracted
+            if len(cache) > _EXTRACT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(raw)
+        return extracted
+
     def _format_answer(self, answer: Union[int, float, str, List[Tuple[str, float, float]]]) -> str:
         """Format answer for consistent output"""
-        if isinstance(answer, list):
-            # Calculus extrema
-            parts = []
-            for typ, x, f_val in answer:
-                parts.append(f"{typ} at x={x:.2f} (f={f_val:.2f})")
-            return ", ".join(parts)
+        # Most frequent answer types first
+        if isinstance(answer, int):
+            return str(answer)
         elif isinstance(answer, float):
             # Check if it's close to an integer
-            if abs(answer - round(answer)) < 1e-9:
-                return str(int(round(answer)))
+            r = round(answer)
+            if abs(answer - r) < 1e-9:
+                return str(r)
             else:
                 return f"{answer:.6f}".rstrip('0').rstrip('.')
+        elif isinstance(answer, list):
+            # Calculus extrema
+            return ", ".join(f"{typ} at x={x:.2f} (f={f_val:.2f})" for typ, x, f_val in answer)
         else:
             return str(answer)
+
+
+_INSTANCE: Optional[Stage5Pipeline] = None
+
+
+def get_pipeline() -> Stage5Pipeline:
+    """
+    Shared pipeline instance, created on first call.
+    Reusing it keeps the extract cache and component state warm across problems.
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = Stage5Pipeline()
+    return _INSTANCE
@@ -1,9 +1,8 @@
 # stage5/solver.py
 from __future__ import annotations
 
-import itertools
-from math import comb, sqrt
-from typing import Union, List, Tuple, Dict
+from math import hypot, sqrt
+from typing import Union, List, Tuple
 
 from .extractor import (
     Extracted,
@@ -15,6 +14,7 @@ from .extractor import (
     CalculusExtracted,
     PatternKind
 )
+from .kernels import ccomb, dice_counts, sigma
 
 
 class Stage5Solver:
@@ -24,32 +24,30 @@ class Stage5Solver:
     No hardcoding, no external data sources.
     """
 
+    def __init__(self) -> None:
+        # Indexed by PatternKind value
+        self._dispatch = (
+            self._solve_combinatorics,
+            self._solve_algebra,
+            self._solve_number_theory,
+            self._solve_geometry,
+            self._solve_probability,
+            self._solve_calculus,
+        )
+
     def solve(self, extracted: Extracted) -> Union[int, float, str, List[Tuple[str, float, float]]]:
         """Dispatch to appropriate solver based on pattern kind"""
-        if extracted.kind == PatternKind.COMBINATORICS:
-            return self._solve_combinatorics(extracted)
-        elif extracted.kind == PatternKind.ALGEBRA:
-            return self._solve_algebra(extracted)
-        elif extracted.kind == PatternKind.NUMBER_THEORY:
-            return self._solve_number_theory(extracted)
-        elif extracted.kind == PatternKind.GEOMETRY:
-            return self._solve_geometry(extracted)
-        elif extracted.kind == PatternKind.PROBABILITY:
-            return self._solve_probability(extracted)
-        elif extracted.kind == PatternKind.CALCULUS:
-            return self._solve_calculus(extracted)
-        else:
+        if not isinstance(extracted.kind, PatternKind):
             raise ValueError(f"Unsupported pattern kind: {extracted.kind}")
+        return self._dispatch[extracted.kind](extracted)
 
     def _solve_combinatorics(self, ex: CombinatoricsExtracted) -> int:
         """
         Contract: Uses ex.n1, ex.n2, ex.cases
         Formula: sum(C(n1, k1_i) × C(n2, k2_i) for each case)
         """
-        total = 0
-        for k1, k2 in ex.cases:
-            total += comb(ex.n1, k1) * comb(ex.n2, k2)
-        return total
+        n1, n2 = ex.n1, ex.n2
+        return sum(ccomb(n1, k1) * ccomb(n2, k2) for k1, k2 in ex.cases)
 
     def _solve_algebra(self, ex: AlgebraExtracted) -> int:
         """
@@ -63,23 +61,19 @@ class Stage5Solver:
         Contract: Uses ex.number
         Formula: σ(n) = Π[(p^(k+1) - 1) / (p - 1)] for prime factorization
         """
-        factors = self._prime_factorization(ex.number)
-        sigma = 1
-        for prime, exp in factors.items():
-            sigma *= (prime ** (exp + 1) - 1) // (prime - 1)
-        return sigma
+        return sigma(ex.number)
 
     def _solve_geometry(self, ex: GeometryExtracted) -> float:
         """
         Contract: Uses ex.radius, ex.tangent
         Formula: OP² = radius² + tangent² (Pythagorean theorem)
         """
-        return sqrt(ex.radius ** 2 + ex.tangent ** 2)
+        return hypot(ex.radius, ex.tangent)
 
     def _solve_probability(self, ex: ProbabilityExtracted) -> float:
         """
         Contract: Uses ex.num_dice, ex.target_sum
-        Method: Brute force enumeration of all outcomes
+        Method: Count favorable outcomes by dynamic programming
         """
         total_outcomes = 6 ** ex.num_dice
         favorable = self._count_dice_sum(ex.num_dice, ex.target_sum)
@@ -99,48 +93,35 @@ class Stage5Solver:
         A = 3 * a
         B = 2 * b
         C = c
+        if A == 0:
+            # Not a cubic; both a == 0 cases stop here with SOLVER_ERROR
+            raise ValueError("Leading coefficient a is 0: not a cubic")
 
-        discriminant = B**2 - 4*A*C
+        discriminant = B * B - 4 * A * C
         if discriminant < 0:
             return []  # No real critical points
 
-        x1 = (-B + sqrt(discriminant)) / (2 * A)
-        x2 = (-B - sqrt(discriminant)) / (2 * A)
-
-        extrema = []
-        for x in [x1, x2]:
-            # f''(x) = 6ax + 2b
-            f_double_prime = 6 * a * x + 2 * b
+        root = sqrt(discriminant)
+        if root == 0:
+            return []  # Double critical point of a cubic: inflection, no extremum
 
-            # f(x) value
-            f_val = a * x**3 + b * x**2 + c * x + d
+        x1 = (-B + root) / (2 * A)
+        x2 = (-B - root) / (2 * A)
 
-            if f_double_prime < 0:
-                extrema.append(("max", round(x, 6), round(f_val, 6)))
-            elif f_double_prime > 0:
-                extrema.append(("min", round(x, 6), round(f_val, 6)))
+        # f''(x) = 6ax + 2b = 2(Ax + b), and A·x1 + b = root / 2, so
+        # f''(x1) = +root > 0 and f''(x2) = -root < 0: x1 is the min, x2 the max
+        f1 = ((a * x1 + b) * x1 + c) * x1 + d  # Horner
+        f2 = ((a * x2 + b) * x2 + c) * x2 + d
+        extrema = [
+            ("min", round(x1, 6), round(f1, 6)),
+            ("max", round(x2, 6), round(f2, 6)),
+        ]
 
         return sorted(extrema, key=lambda t: t[1])  # sort by x value
 
     # Helper methods
 
-    def _prime_factorization(self, n: int) -> Dict[int, int]:
-        """Return prime factorization as {prime: exponent}"""
-        factors = {}
-        d = 2
-        while d * d <= n:
-            while n % d == 0:
-                factors[d] = factors.get(d, 0) + 1
-                n //= d
-            d += 1
-        if n > 1:
-            factors[n] = 1
-        return factors
-
     def _count_dice_sum(self, num_dice: int, target_sum: int) -> int:
         """Count how many ways to get target_sum with num_dice dice"""
-        count = 0
-        for outcome in itertools.product(range(1, 7), repeat=num_dice):
-            if sum(outcome) == target_sum:
-                count += 1
-        return count
+        counts = dice_counts(num_dice)
+        return counts[target_sum] if target_sum < len(counts) else 0
@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import comb, isclose
-from typing import Callable, List, Optional, Union, Tuple
+from math import hypot, isclose, isqrt
+from typing import List, Optional, Union, Tuple
 
 from .extractor import (
     Extracted,
@@ -15,9 +15,11 @@ from .extractor import (
     CalculusExtracted,
     PatternKind
 )
+from ._compat import DATACLASS_SLOTS
+from .kernels import ccomb
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class VerifyResult:
     ok: bool
     guard_code: Optional[str] = None
@@ -26,33 +28,37 @@ class VerifyResult:
     reason: Optional[str] = None
 
 
+# Shared PASS result (immutable), so a passing verification allocates nothing
+_VERIFY_OK = VerifyResult(ok=True)
+
+
 class Stage5Verifier:
     """
     Loopless 'self-correction': not retrying generation,
     but performing multiple independent deterministic checks.
 
     Rule: ALL checks must PASS.
+    Checks run in order; the first failure (or exception) stops verification.
     """
 
+    def __init__(self) -> None:
+        # Indexed by PatternKind value
+        self._dispatch = (
+            self._verify_combinatorics,
+            self._verify_algebra,
+            self._verify_number_theory,
+            self._verify_geometry,
+            self._verify_probability,
+            self._verify_calculus,
+        )
+
     def verify(
         self,
         extracted: Extracted,
         answer: Union[int, float, str, List[Tuple[str, float, float]]]
     ) -> VerifyResult:
         """Dispatch to appropriate verifier based on pattern kind"""
-        if extracted.kind == PatternKind.COMBINATORICS:
-            return self._verify_combinatorics(extracted, answer)
-        elif extracted.kind == PatternKind.ALGEBRA:
-            return self._verify_algebra(extracted, answer)
-        elif extracted.kind == PatternKind.NUMBER_THEORY:
-            return self._verify_number_theory(extracted, answer)
-        elif extracted.kind == PatternKind.GEOMETRY:
-            return self._verify_geometry(extracted, answer)
-        elif extracted.kind == PatternKind.PROBABILITY:
-            return self._verify_probability(extracted, answer)
-        elif extracted.kind == PatternKind.CALCULUS:
-            return self._verify_calculus(extracted, answer)
-        else:
+        if not isinstance(extracted.kind, PatternKind):
             return VerifyResult(
                 ok=False,
                 guard_code="UNSUPPORTED_KIND",
@@ -60,66 +66,86 @@ class Stage5Verifier:
                 guard_action="STOP",
                 reason=f"Unsupported pattern kind: {extracted.kind}"
             )
+        return self._dispatch[extracted.kind](extracted, answer)
 
     def _verify_combinatorics(self, ex: CombinatoricsExtracted, answer: int) -> VerifyResult:
         """Verify combinatorics answer"""
-        # Recompute
-        expected = sum(comb(ex.n1, k1) * comb(ex.n2, k2) for k1, k2 in ex.cases)
-
-        checks: List[Callable[[], bool]] = [
-            lambda: answer == expected,
-            lambda: answer > 0,  # combinatorics result must be positive
-            lambda: all(answer % comb(ex.n1, k1) == 0 for k1, _ in ex.cases),  # divisibility check
-        ]
-
-        return self._run_checks(checks)
+        # Recompute (each C(n, k) evaluated once, shared by all checks)
+        c1 = [ccomb(ex.n1, k1) for k1, _ in ex.cases]
+        c2 = [ccomb(ex.n2, k2) for _, k2 in ex.cases]
+        expected = sum(a * b for a, b in zip(c1, c2))
+
+        try:
+            if answer != expected:
+                return self._check_failed(0)
+            if not answer > 0:  # combinatorics result must be positive
+                return self._check_failed(1)
+            # Divisibility only holds for a single-term sum C(n1,k1) × C(n2,k2)
+            if len(c1) == 1 and answer % c1[0] != 0:
+                return self._check_failed(2)
+        except Exception as e:
+            return self._check_error(e)
+
+        return _VERIFY_OK
 
     def _verify_algebra(self, ex: AlgebraExtracted, answer: int) -> VerifyResult:
         """Verify algebra answer"""
         expected = ex.x2_plus_y2 + 2 * ex.xy
 
-        checks: List[Callable[[], bool]] = [
-            lambda: answer == expected,
-            lambda: answer > 0,  # (x+y)² must be non-negative
-        ]
+        try:
+            if answer != expected:
+                return self._check_failed(0)
+            if not answer > 0:  # (x+y)² must be non-negative
+                return self._check_failed(1)
+        except Exception as e:
+            return self._check_error(e)
 
-        return self._run_checks(checks)
+        return _VERIFY_OK
 
     def _verify_number_theory(self, ex: NumberTheoryExtracted, answer: int) -> VerifyResult:
         """Verify number theory answer (divisor sum)"""
         # Recompute divisor sum
-        divisors = self._get_divisors(ex.number)
-        expected = sum(divisors)
+        expected = self._divisor_sum(ex.number)
 
-        checks: List[Callable[[], bool]] = [
-            lambda: answer == expected,
-            lambda: answer >= ex.number + 1,  # σ(n) >= n + 1 for n > 1
-            lambda: answer > ex.number,  # σ(n) > n always
-        ]
+        try:
+            if answer != expected:
+                return self._check_failed(0)
+            if not answer >= ex.number + 1:  # σ(n) >= n + 1 for n > 1
+                return self._check_failed(1)
+            if not answer > ex.number:  # σ(n) > n always
+                return self._check_failed(2)
+        except Exception as e:
+            return self._check_error(e)
 
-        return self._run_checks(checks)
+        return _VERIFY_OK
 
     def _verify_geometry(self, ex: GeometryExtracted, answer: float) -> VerifyResult:
         """Verify geometry answer"""
-        from math import sqrt
-        expected = sqrt(ex.radius**2 + ex.tangent**2)
+        expected = hypot(ex.radius, ex.tangent)
 
-        checks: List[Callable[[], bool]] = [
-            lambda: isclose(answer, expected, rel_tol=1e-9),
-            lambda: answer > ex.radius,  # OP > radius
-            lambda: answer > ex.tangent,  # OP > tangent
-        ]
+        try:
+            if not isclose(answer, expected, rel_tol=1e-9):
+                return self._check_failed(0)
+            if not answer > ex.radius:  # OP > radius
+                return self._check_failed(1)
+            if not answer > ex.tangent:  # OP > tangent
+                return self._check_failed(2)
+        except Exception as e:
+            return self._check_error(e)
 
-        return self._run_checks(checks)
+        return _VERIFY_OK
 
     def _verify_probability(self, ex: ProbabilityExtracted, answer: float) -> VerifyResult:
         """Verify probability answer"""
-        checks: List[Callable[[], bool]] = [
-            lambda: 0 <= answer <= 1,  # probability must be in [0, 1]
-            lambda: answer > 0,  # should be positive for reasonable target sums
-        ]
+        try:
+            if not 0 <= answer <= 1:  # probability must be in [0, 1]
+                return self._check_failed(0)
+            if not answer > 0:  # should be positive for reasonable target sums
+                return self._check_failed(1)
+        except Exception as e:
+            return self._check_error(e)
 
-        return self._run_checks(checks)
+        return _VERIFY_OK
 
     def _verify_calculus(
         self,
@@ -137,44 +163,45 @@ class Stage5Verifier:
             )
 
         # Basic sanity checks
-        checks: List[Callable[[], bool]] = [
-            lambda: len(answer) <= 2,  # cubic has at most 2 extrema
-            lambda: all(t[0] in ("max", "min") for t in answer),  # valid types
-        ]
+        try:
+            if not len(answer) <= 2:  # cubic has at most 2 extrema
+                return self._check_failed(0)
+            if not all(t[0] in ("max", "min") for t in answer):  # valid types
+                return self._check_failed(1)
+        except Exception as e:
+            return self._check_error(e)
 
-        return self._run_checks(checks)
+        return _VERIFY_OK
 
     # Helper methods
 
-    def _run_checks(self, checks: List[Callable[[], bool]]) -> VerifyResult:
-        """Run all checks, return FAIL on first failure"""
-        for idx, chk in enumerate(checks):
-            try:
-                if not chk():
-                    return VerifyResult(
-                        ok=False,
-                        guard_code="VERIFY_FAIL",
-                        guard_state="VERIFY_FAIL",
-                        guard_action="STOP",
-                        reason=f"Verifier check {idx} failed.",
-                    )
-            except Exception as e:
-                return VerifyResult(
-                    ok=False,
-                    guard_code="VERIFY_ERROR",
-                    guard_state="VERIFY_ERROR",
-                    guard_action="STOP",
-                    reason=f"Verifier exception: {e!r}",
-                )
-
-        return VerifyResult(ok=True)
-
-    def _get_divisors(self, n: int) -> List[int]:
-        """Get all divisors of n"""
-        divisors = []
-        for i in range(1, int(n**0.5) + 1):
+    def _check_failed(self, idx: int) -> VerifyResult:
+        """FAIL result for the check at position idx"""
+        return VerifyResult(
+            ok=False,
+            guard_code="VERIFY_FAIL",
+            guard_state="VERIFY_FAIL",
+            guard_action="STOP",
+            reason=f"Verifier check {idx} failed.",
+        )
+
+    def _check_error(self, e: Exception) -> VerifyResult:
+        """ERROR result for a check that raised"""
+        return VerifyResult(
+            ok=False,
+            guard_code="VERIFY_ERROR",
+            guard_state="VERIFY_ERROR",
+            guard_action="STOP",
+            reason=f"Verifier exception: {e!r}",
+        )
+
+    def _divisor_sum(self, n: int) -> int:
+        """Sum of all divisors of n, accumulated pairwise (i, n // i)"""
+        s = 0
+        for i in range(1, isqrt(n) + 1):
             if n % i == 0:
-                divisors.append(i)
-                if i != n // i:
-                    divisors.append(n // i)
-        return sorted(divisors)
+                s += i
+                j = n // i
+                if j != i:
+                    s += j
+        return s